@@ -0,0 +1,191 @@
+## Render a SegmentedThreeDScene with one manim process per segment, e.g. ##
+##   python ParallelRendering.py VisualizeModulusOfComplexFunction.py ModulusGraphRealZero --workers 8 -- -qh ##
+## Options after "--" are passed to every manim worker, except those that would write, open or skip ##
+## something per worker (-o, -p, -f, -a, -n, -s, -g, -i, -t, --save_sections, --format, --media_dir). ##
+## A plain "manim" call on the same scene still renders it serially, as before. ##
+from manim import *
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# environment variable telling a worker which segment it renders, as "index/count"
+SEGMENT_VARIABLE = "MANIM_RENDER_SEGMENT"
+
+# manim options that cannot be given to the workers, as short flags and long names
+REJECTED_SHORT_OPTIONS = "opfansgit"
+REJECTED_LONG_OPTIONS = (
+    "--output_file", "--media_dir", "--preview", "--show_in_file_browser", "--write_all",
+    "--from_animation_number", "--save_sections", "--save_last_frame", "--format",
+    "--transparent", "--save_pngs", "--save_as_gif",
+)
+
+# short manim options that take a value, which may be glued to them (e.g. "-qh")
+VALUE_SHORT_OPTIONS = "qrcv"
+
+
+def segment_durations(duration, frame_rate, number_of_segments):
+    # split on frame boundaries, so that the concatenated segments have exactly
+    # the frames of the serial rendering
+    total_frames = round(duration * frame_rate)
+    if total_frames < number_of_segments:
+        raise ValueError(
+            f"cannot split {total_frames} frames into {number_of_segments} segments, "
+            "use fewer workers"
+        )
+    bounds = np.linspace(0, total_frames, number_of_segments + 1).round().astype(int)
+
+    # manim renders np.arange(0, run_time, 1 / frame_rate), where rounding errors can
+    # add or drop a frame: nudge each duration until it gives exactly its frames
+    durations = []
+    for frames in np.diff(bounds):
+        segment_duration = frames / frame_rate
+        while len(np.arange(0, segment_duration, 1 / frame_rate)) > frames:
+            segment_duration = np.nextafter(segment_duration, 0)
+        while len(np.arange(0, segment_duration, 1 / frame_rate)) < frames:
+            segment_duration = np.nextafter(segment_duration, np.inf)
+        durations.append(float(segment_duration))
+    return durations
+
+
+class SegmentedThreeDScene(ThreeDScene):
+    """ThreeDScene whose timeline can be split into segments rendered by separate processes.
+
+    Every frame of these scenes is a function of time only, so a worker can skip the
+    segments that are not its own (the updaters still advance the camera) and render
+    just its slice of the timeline; the slices are then concatenated without re-encoding.
+    """
+
+    def setup(self):
+        super().setup()
+
+        # without the environment variable the whole timeline is rendered as one segment
+        segment = os.environ.get(SEGMENT_VARIABLE)
+        if segment is None:
+            self.rendered_segment, self.number_of_segments = None, 1
+        else:
+            self.rendered_segment, self.number_of_segments = map(int, segment.split("/"))
+            if not 0 <= self.rendered_segment < self.number_of_segments:
+                raise ValueError(f"invalid {SEGMENT_VARIABLE}={segment}, expected index/count")
+
+    def segment_durations(self, duration):
+        return segment_durations(duration, config.frame_rate, self.number_of_segments)
+
+    def begin_segment(self, index):
+        if self.rendered_segment is not None:
+            self.next_section(
+                f"segment {index}", skip_animations=index != self.rendered_segment
+            )
+
+    def wait_in_segments(self, duration):
+        for index, segment_duration in enumerate(self.segment_durations(duration)):
+            self.begin_segment(index)
+            self.wait(segment_duration)
+
+
+def rejected_manim_arg(manim_args):
+    for manim_arg in manim_args:
+        if manim_arg.startswith(REJECTED_LONG_OPTIONS):
+            return manim_arg
+        if manim_arg.startswith("-") and not manim_arg.startswith("--"):
+            # short flags can be grouped, e.g. "-pqh"
+            for flag in manim_arg[1:]:
+                if flag in REJECTED_SHORT_OPTIONS:
+                    return manim_arg
+                if flag in VALUE_SHORT_OPTIONS:
+                    break
+    return None
+
+
+def render_in_parallel(file, scene, workers, manim_args, output=None):
+    work_dir = Path("media") / "parallel" / scene
+    if output is None:
+        output = work_dir.parent / f"{scene}.mp4"
+
+    # start from an empty working directory, so that no movie of a previous run is reused
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+    # start one manim process per segment, each one with its own media directory and movie
+    segment_dirs = [work_dir / f"segment_{index}" for index in range(workers)]
+    movies = [(segment_dir / "segment.mp4").absolute() for segment_dir in segment_dirs]
+    processes = []
+    try:
+        for index, (segment_dir, movie) in enumerate(zip(segment_dirs, movies)):
+            processes.append(subprocess.Popen(
+                [sys.executable, "-m", "manim", "render", *manim_args,
+                 "--media_dir", str(segment_dir), "-o", str(movie), file, scene],
+                env=dict(os.environ, **{SEGMENT_VARIABLE: f"{index}/{workers}"}),
+            ))
+
+        # watch all the workers together, and stop the others as soon as one of them fails
+        return_codes = {}
+        while len(return_codes) < len(processes):
+            for index, process in enumerate(processes):
+                if index not in return_codes and process.poll() is not None:
+                    return_codes[index] = process.returncode
+            if any(return_codes.values()):
+                break
+            time.sleep(0.1)
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in processes:
+            process.wait()
+
+    failed = sorted(index for index, return_code in return_codes.items() if return_code != 0)
+    if failed:
+        raise RuntimeError(
+            f"rendering {scene} failed in segment(s) {failed} (see the worker output above), "
+            "the other workers were stopped"
+        )
+    missing = [index for index, movie in enumerate(movies) if not movie.is_file()]
+    if missing:
+        raise RuntimeError(f"rendering {scene} produced no movie for segment(s) {missing}")
+
+    # concatenate them without re-encoding
+    list_file = work_dir / "segments.txt"
+    list_file.write_text("".join(
+        "file '{}'\n".format(str(movie).replace("'", "'\\''")) for movie in movies
+    ))
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", str(list_file), "-c", "copy", str(output)],
+        check=True,
+    )
+    return output
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Render a SegmentedThreeDScene in parallel.",
+        epilog='Options after "--" are passed to manim, e.g. "-- -qh".',
+    )
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    # every worker imports manim and needs at least one frame, so do not use all the cores
+    # of a large machine by default
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count(), 8))
+    parser.add_argument("--output", type=Path)
+
+    # split our own arguments from the manim ones, so that no option value is misparsed
+    argv = sys.argv[1:]
+    if "--" in argv:
+        argv, manim_args = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+    else:
+        manim_args = []
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    manim_arg = rejected_manim_arg(manim_args)
+    if manim_arg is not None:
+        parser.error(
+            f"{manim_arg} cannot be used when rendering in parallel, "
+            "use --output to choose where the final movie goes"
+        )
+
+    print(render_in_parallel(args.file, args.scene, args.workers, manim_args, args.output))
@@ -1,6 +1,7 @@
 from manim import *
+from ParallelRendering import SegmentedThreeDScene
 
-class VisualizeComplexExponential(ThreeDScene):
+class VisualizeComplexExponential(SegmentedThreeDScene):
     def construct(self):
 
         # define how long the animation should last in seconds
@@ -45,6 +46,14 @@ class VisualizeComplexExponential(ThreeDScene):
         )
         self.add(dot)
 
+        # draw the function up to T, so that it is created as the point moves
+        partial_expt = always_redraw(
+            lambda: expt.copy().pointwise_become_partial(
+                expt, 0, (T.get_value() - t_min) / (t_max - t_min)
+            )
+        )
+        self.add(partial_expt)
+
         # set how the visualization should look like
         self.set_camera_orientation(theta=-45 * DEGREES, phi=60 * DEGREES)
         self.add(axes, x_label, y_label, z_label)
@@ -52,8 +61,16 @@ class VisualizeComplexExponential(ThreeDScene):
             rate=PI / 10, about="theta"
         )  # note: make it rotate at a rate of PI/10 radians per second
 
-        # make the animation
-        self.play(T.animate.set_value(t_max), Create(expt), run_time=runtime, rate_func=linear)
+        # make the animation, one segment of the timeline at a time
+        segment_durations = self.segment_durations(runtime)
+        elapsed = 0
+        for index, segment_duration in enumerate(segment_durations):
+            self.begin_segment(index)
+            elapsed += segment_duration
+            self.play(
+                T.animate.set_value(t_min + (t_max - t_min) * elapsed / sum(segment_durations)),
+                run_time=segment_duration, rate_func=linear
+            )
 
         # do not close the video at its end
         self.wait()
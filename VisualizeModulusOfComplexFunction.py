@@ -1,7 +1,8 @@
 from manim import *
 import numpy as np
+from ParallelRendering import SegmentedThreeDScene
 
-class ModulusGraphRealZero(ThreeDScene):
+class ModulusGraphRealZero(SegmentedThreeDScene):
     def construct(self):
         
         # define how long the animation should last in seconds
@@ -49,11 +50,11 @@ class ModulusGraphRealZero(ThreeDScene):
 
         # do not close the video at its end
         self.begin_3dillusion_camera_rotation(rate=2)
-        self.wait(runtime)
+        self.wait_in_segments(runtime)
 
 
 
-class ModulusGraphComplexConjugateZeros(ThreeDScene):
+class ModulusGraphComplexConjugateZeros(SegmentedThreeDScene):
     def construct(self):
         
         # define how long the animation should last in seconds
@@ -101,10 +102,10 @@ class ModulusGraphComplexConjugateZeros(ThreeDScene):
 
         # do not close the video at its end
         self.begin_3dillusion_camera_rotation(rate=2)
-        self.wait(runtime)
+        self.wait_in_segments(runtime)
 
 
-class ModulusGraphRealPole(ThreeDScene):
+class ModulusGraphRealPole(SegmentedThreeDScene):
     def construct(self):
         
         # define how long the animation should last in seconds
@@ -152,10 +153,10 @@ class ModulusGraphRealPole(ThreeDScene):
 
         # do not close the video at its end
         self.begin_3dillusion_camera_rotation(rate=2)
-        self.wait(runtime)
+        self.wait_in_segments(runtime)
 
 
-class ModulusGraphComplexConjugatePoles(ThreeDScene):
+class ModulusGraphComplexConjugatePoles(SegmentedThreeDScene):
     def construct(self):
         
         # define how long the animation should last in seconds
@@ -203,10 +204,10 @@ class ModulusGraphComplexConjugatePoles(ThreeDScene):
 
         # do not close the video at its end
         self.begin_3dillusion_camera_rotation(rate=2)
-        self.wait(runtime)
+        self.wait_in_segments(runtime)
 
 
-class ModulusGraphGenericTF(ThreeDScene):
+class ModulusGraphGenericTF(SegmentedThreeDScene):
     def construct(self):
         
         # define how long the animation should last in seconds
@@ -254,5 +255,5 @@ class ModulusGraphGenericTF(ThreeDScene):
 
         # do not close the video at its end
         self.begin_3dillusion_camera_rotation(rate=2)
-        self.wait(runtime)
+        self.wait_in_segments(runtime)
 
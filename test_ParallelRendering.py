@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from ParallelRendering import segment_durations
+
+
+@pytest.mark.parametrize("frame_rate", [15, 30, 60])
+@pytest.mark.parametrize("number_of_segments", range(1, 33))
+@pytest.mark.parametrize("runtime", [5, 10])
+def test_segments_have_the_frames_of_the_serial_rendering(frame_rate, number_of_segments, runtime):
+    durations = segment_durations(runtime, frame_rate, number_of_segments)
+
+    # count the frames as manim does for each play or wait
+    frames = [len(np.arange(0, duration, 1 / frame_rate)) for duration in durations]
+    assert len(frames) == number_of_segments
+    assert sum(frames) == runtime * frame_rate
+    assert max(frames) - min(frames) <= 1
+
+
+def test_more_segments_than_frames_are_rejected():
+    with pytest.raises(ValueError):
+        segment_durations(1, 15, 16)